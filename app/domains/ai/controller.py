@@ -1,6 +1,7 @@
 """AI API controller with FastAPI endpoints."""
 
 import logging
+from collections.abc import Callable
 
 from fastapi import APIRouter, Body, Depends, Request, status
 from fastapi.responses import JSONResponse
@@ -38,16 +39,26 @@ router = APIRouter(
 )
 
 
+def get_ai_service() -> Callable[[AsyncSession], AIService]:
+    """Provide the AI service factory.
+
+    Endpoints build the service inside their own error handling, since construction
+    raises AIConfigurationError when no API key is set. Tests override this dependency.
+    """
+    return AIService
+
+
 @router.post("/generate-subtasks", response_model=ResponseSchema, status_code=201)
 async def generate_subtasks(
     _request: Request,
     generation_request: SubtaskGenerationRequest = Body(...),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    ai_service: Callable[[AsyncSession], AIService] = Depends(get_ai_service),
 ):
     """Generate AI subtasks for a given task."""
     try:
-        service = AIService(db)
+        service = ai_service(db)
         result = await service.generate_subtasks(request=generation_request, user_id=current_user.id)
 
         return ResponseSchema(
@@ -190,10 +201,11 @@ async def analyze_file(
     analysis_request: FileAnalysisRequest = Body(...),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    ai_service: Callable[[AsyncSession], AIService] = Depends(get_ai_service),
 ):
     """Analyze a file using AI."""
     try:
-        service = AIService(db)
+        service = ai_service(db)
         result = await service.analyze_file(request=analysis_request, user_id=current_user.id)
 
         return ResponseSchema(
@@ -236,10 +248,11 @@ async def get_ai_service_status(
     _request: Request,
     _current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    ai_service: Callable[[AsyncSession], AIService] = Depends(get_ai_service),
 ):
     """Get AI service status and availability."""
     try:
-        service = AIService(db)
+        service = ai_service(db)
         status_info = await service.get_service_status()
 
         return ResponseSchema(
@@ -264,10 +277,11 @@ async def suggest_todos(
     suggestion_request: TodoSuggestionRequest = Body(...),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    ai_service: Callable[[AsyncSession], AIService] = Depends(get_ai_service),
 ):
     """Generate AI todo suggestions based on user input."""
     try:
-        service = AIService(db)
+        service = ai_service(db)
         result = await service.suggest_todos(request=suggestion_request, user_id=current_user.id)
 
         return ResponseSchema(
@@ -311,10 +325,11 @@ async def optimize_task(
     optimization_request: TaskOptimizationRequest = Body(...),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    ai_service: Callable[[AsyncSession], AIService] = Depends(get_ai_service),
 ):
     """Optimize an existing task using AI."""
     try:
-        service = AIService(db)
+        service = ai_service(db)
         result = await service.optimize_task(request=optimization_request, user_id=current_user.id)
 
         return ResponseSchema(
@@ -3,7 +3,7 @@
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_, desc, func, or_
+from sqlalchemy import and_, delete, desc, func, or_, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
@@ -14,6 +14,7 @@ from app.schemas.project import ProjectCreate, ProjectFilter, ProjectUpdate
 from app.shared.pagination import PaginationParams, paginate
 from models.project import Project
 from models.todo import Todo
+from models.todo_partitioned import TodoActive, TodoArchived
 
 
 class ProjectService:
@@ -130,15 +131,12 @@ class ProjectService:
             raise NotFoundError("Project not found")
 
         try:
-            # Check if project has todos
-            todo_count = await self._get_project_todo_count(project_id)
-            if todo_count > 0:
-                # Option 1: Set todos' project_id to None instead of deleting
-                await self._unassign_todos_from_project(project_id)
-                # Option 2: Delete all todos (uncomment if preferred)
-                # await self._delete_project_todos(project_id)
-
-            await self.db.delete(project)
+            # Option 1: Set todos' project_id to None instead of deleting
+            await self._unassign_todos_from_project(project_id)
+            # Option 2: Delete all todos (uncomment if preferred)
+            # await self._delete_project_todos(project_id)
+
+            await self.db.execute(delete(Project).where(Project.id == project_id))
             await self.db.commit()
             return True
         except SQLAlchemyError as e:
@@ -237,19 +235,10 @@ class ProjectService:
         return result.scalar() or 0
 
     async def _unassign_todos_from_project(self, project_id: UUID):
-        """Set project_id to None for all todos in the project."""
-        stmt = select(Todo).where(Todo.project_id == project_id)
-        result = await self.db.execute(stmt)
-        todos = result.scalars().all()
-
-        for todo in todos:
-            todo.project_id = None
+        """Set project_id to None for all todos in the project, active and archived included."""
+        for model in (Todo, TodoActive, TodoArchived):
+            await self.db.execute(update(model).where(model.project_id == project_id).values(project_id=None))
 
     async def _delete_project_todos(self, project_id: UUID):
         """Delete all todos in a project."""
-        stmt = select(Todo).where(Todo.project_id == project_id)
-        result = await self.db.execute(stmt)
-        todos = result.scalars().all()
-
-        for todo in todos:
-            await self.db.delete(todo)
+        await self.db.execute(delete(Todo).where(Todo.project_id == project_id))
@@ -13,7 +13,7 @@ from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_, desc, func, or_, select
+from sqlalchemy import DateTime, and_, delete, desc, func, insert, literal, or_, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -27,6 +27,24 @@ from app.shared.pagination import PaginationParams, paginate
 from models.project import Project
 from models.todo_partitioned import Todo, TodoActive, TodoArchived
 
+# Columns carried over verbatim when a todo moves from the active to the archived partition
+ARCHIVE_COPY_COLUMNS = (
+    "id",
+    "user_id",
+    "project_id",
+    "parent_todo_id",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "due_date",
+    "completed_at",
+    "ai_generated",
+    "depth",
+    "created_at",
+    "updated_at",
+)
+
 
 class PartitionedTodoService:
     """Service class for partitioned todo business logic."""
@@ -263,51 +281,55 @@ class PartitionedTodoService:
             "completion_rate": (total_completed / total_todos * 100) if total_todos > 0 else 0,
         }
 
-    async def move_completed_todos_to_archive(self, days_old: int = 30) -> int:
+    async def move_completed_todos_to_archive(self, days_old: int = 30, batch_size: int = 1000) -> int:
         """Manual archival method for moving completed todos to archive partition.
 
+        Rows are moved in batches of ``batch_size``, each in its own transaction.
+        Batches are claimed with ``FOR UPDATE SKIP LOCKED`` so several maintenance
+        workers can archive concurrently without blocking each other or hot-path
+        writes to the same rows.
+
         Returns the number of todos archived.
         Note: This is typically handled by automated maintenance jobs.
         """
         cutoff_date = datetime.now(UTC) - timedelta(days=days_old)
 
-        # Find completed todos older than cutoff
-        query = select(TodoActive).where(and_(TodoActive.status == "done", TodoActive.completed_at < cutoff_date))
-
-        result = await self.db.execute(query)
-        todos_to_archive = result.scalars().all()
+        claim_query = (
+            select(TodoActive.id)
+            .where(and_(TodoActive.status == "done", TodoActive.completed_at < cutoff_date))
+            .order_by(TodoActive.completed_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
 
         archived_count = 0
-        for todo in todos_to_archive:
-            # Create archived version
-            archived_todo = TodoArchived(
-                id=todo.id,
-                user_id=todo.user_id,
-                project_id=todo.project_id,
-                parent_todo_id=todo.parent_todo_id,
-                title=todo.title,
-                description=todo.description,
-                status=todo.status,
-                priority=todo.priority,
-                due_date=todo.due_date,
-                completed_at=todo.completed_at,
-                ai_generated=todo.ai_generated,
-                depth=todo.depth,
-                created_at=todo.created_at,
-                updated_at=todo.updated_at,
-            )
+        while True:
+            try:
+                result = await self.db.execute(claim_query)
+                todo_ids = result.scalars().all()
+                if not todo_ids:
+                    await self.db.commit()
+                    break
+
+                # Copy and delete server-side so rows never round-trip through the ORM
+                archived_at = literal(datetime.now(UTC), DateTime(timezone=True))
+                copy_query = select(*(getattr(TodoActive, name) for name in ARCHIVE_COPY_COLUMNS), archived_at).where(
+                    TodoActive.id.in_(todo_ids)
+                )
+                await self.db.execute(
+                    insert(TodoArchived).from_select([*ARCHIVE_COPY_COLUMNS, "archived_at"], copy_query)
+                )
+                await self.db.execute(
+                    delete(TodoActive).where(TodoActive.id.in_(todo_ids)).execution_options(synchronize_session=False)
+                )
+                await self.db.commit()
+            except SQLAlchemyError as e:
+                await self.db.rollback()
+                raise InvalidTodoOperationError(f"Failed to archive todos: {str(e)}") from e
 
-            # Add to archive and remove from active
-            self.db.add(archived_todo)
-            await self.db.delete(todo)
-            archived_count += 1
+            archived_count += len(todo_ids)
 
-        try:
-            await self.db.commit()
-            return archived_count
-        except SQLAlchemyError as e:
-            await self.db.rollback()
-            raise InvalidTodoOperationError(f"Failed to archive todos: {str(e)}") from e
+        return archived_count
 
     # Private helper methods
 
@@ -2,11 +2,24 @@
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from models import User
+from models import (
+    AIInteraction,
+    AITodoInteraction,
+    ChatConversation,
+    ChatMessage,
+    File,
+    Project,
+    PushSubscription,
+    Todo,
+    TodoActive,
+    TodoArchived,
+    User,
+    UserSettings,
+)
 
 
 class UserService:
@@ -104,7 +117,8 @@ class UserService:
             return False
 
         try:
-            await self.db.delete(user)
+            await self._delete_user_data(user_id)
+            await self.db.execute(delete(User).where(User.id == user_id))
             await self.db.commit()
             return True
         except SQLAlchemyError as e:
@@ -126,3 +140,24 @@ class UserService:
             "created_at": user.created_at,
             "updated_at": user.updated_at,
         }
+
+    async def _delete_user_data(self, user_id: UUID):
+        """Delete everything owned by a user with one DELETE per table, children before parents."""
+        conversation_ids = select(ChatConversation.id).where(ChatConversation.user_id == user_id)
+
+        for stmt in (
+            delete(ChatMessage).where(ChatMessage.conversation_id.in_(conversation_ids)),
+            delete(ChatConversation).where(ChatConversation.user_id == user_id),
+            delete(AIInteraction).where(AIInteraction.user_id == user_id),
+            delete(AITodoInteraction).where(AITodoInteraction.user_id == user_id),
+            delete(File).where(File.user_id == user_id),
+            delete(Todo).where(Todo.user_id == user_id),
+            delete(TodoActive).where(TodoActive.user_id == user_id),
+            delete(TodoArchived).where(TodoArchived.user_id == user_id),
+            delete(Project).where(Project.user_id == user_id),
+            delete(PushSubscription).where(PushSubscription.user_id == user_id),
+            delete(UserSettings).where(UserSettings.user_id == user_id),
+        ):
+            # The rows are gone in the database; skip matching them against the identity map.
+            await self.db.execute(stmt.execution_options(synchronize_session=False))
+        self.db.expire_all()
@@ -37,7 +37,7 @@ class UserSettingsUpdate(BaseSchema):
     @classmethod
     def validate_language(cls, v: str | None) -> str | None:
         """Validate language code format."""
-        if v is not None and v:
+        if v is not None:
             if not v.strip():
                 raise ValueError("Language code cannot be empty")
             # Basic validation for language code format (2-5 chars, letters and hyphens)
@@ -42,25 +42,28 @@ async def paginate(db: AsyncSession, query: Select, pagination: PaginationParams
     Returns:
         Dictionary with pagination info and items
     """
-    # Get total count by creating a count query from the original query's subquery
-    subquery = query.subquery()
-    count_query = select(func.count()).select_from(subquery)
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+    # Fetch the page and the total row count in one round trip via a window count
+    offset = (pagination.page - 1) * pagination.size
+    paginated_query = query.add_columns(func.count().over().label("total")).offset(offset).limit(pagination.size)
+    result = await db.execute(paginated_query)
+    rows = result.all()
+    items = [row[0] for row in rows]
+
+    if rows:
+        total = rows[0].total
+    elif pagination.page == 1:
+        total = 0
+    else:
+        # Past the last page no row carries the window count, so count the original query
+        count_query = select(func.count()).select_from(query.subquery())
+        total_result = await db.execute(count_query)
+        total = total_result.scalar() or 0
 
     # Calculate pagination info
     total_pages = (total + pagination.size - 1) // pagination.size  # Ceiling division
     has_next = pagination.page < total_pages
     has_prev = pagination.page > 1
 
-    # Apply pagination to query
-    offset = (pagination.page - 1) * pagination.size
-    paginated_query = query.offset(offset).limit(pagination.size)
-
-    # Execute query
-    result = await db.execute(paginated_query)
-    items = result.scalars().all()
-
     return {
         "items": items,
         "total": total,
@@ -64,4 +64,5 @@ echo ""
 echo "Manual maintenance commands:"
 echo "- Run daily maintenance: psql \"$DB_CONNECTION\" -c \"SELECT * FROM run_daily_maintenance();\""
 echo "- Run weekly maintenance: psql \"$DB_CONNECTION\" -c \"SELECT * FROM run_weekly_maintenance();\""
-echo "- Archive old todos: psql \"$DB_CONNECTION\" -c \"SELECT * FROM archive_completed_todos(30, 1000);\""
\ No newline at end of file
+echo "- Archive old todos: psql \"$DB_CONNECTION\" -c \"SELECT * FROM archive_completed_todos(30, 1000);\""
+echo "- Drop archive partitions older than 24 months: psql \"$DB_CONNECTION\" -c \"SELECT detach_old_todos_archived_partitions(24);\""
\ No newline at end of file
@@ -248,22 +248,34 @@ class File(BaseModel):
 # MIGRATION HELPER FUNCTIONS
 # ====================================================================
 
-def get_all_user_todos(db_session, user_id: UUID, include_archived: bool = False):
+# Columns needed by list views; everything else (description, audit timestamps, ...) stays deferred
+LIST_VIEW_FIELDS = ('id', 'title', 'status', 'priority', 'due_date', 'completed_at')
+
+
+def get_all_user_todos(
+    db_session, user_id: UUID, include_archived: bool = False, fields: tuple[str, ...] | None = LIST_VIEW_FIELDS
+):
     """
     Helper function to get all todos for a user from both active and archived tables.
     Use this instead of direct model queries during transition period.
+
+    Only ``fields`` are selected (pass None for full rows); any other column is
+    loaded lazily on first access.
     """
-    from sqlalchemy import union_all
-    from sqlalchemy.orm import Session
+    from sqlalchemy.orm import load_only
 
     # Get active todos
     active_query = db_session.query(TodoActive).filter(TodoActive.user_id == user_id)
+    if fields:
+        active_query = active_query.options(load_only(*[getattr(TodoActive, f) for f in fields]))
     
     if not include_archived:
         return active_query.all()
     
     # Get archived todos and combine
     archived_query = db_session.query(TodoArchived).filter(TodoArchived.user_id == user_id)
+    if fields:
+        archived_query = archived_query.options(load_only(*[getattr(TodoArchived, f) for f in fields]))
     
     # Convert to unified format (you'll need to implement this based on your needs)
     active_todos = [Todo.from_active(t) for t in active_query.all()]
@@ -0,0 +1,87 @@
+"""Let the database cascade deletes along owner foreign keys
+
+Revision ID: a5c19e7d3b28
+Revises: f3b8d2a6c417
+Create Date: 2025-10-14 09:12:40.581736
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a5c19e7d3b28'
+down_revision: str | None = 'f3b8d2a6c417'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, column, referenced table, ON DELETE action). Deleting a project keeps
+# its todos, legacy and partitioned alike, matching ProjectService.delete_project.
+FOREIGN_KEYS = (
+    ('todos', 'user_id', 'users', 'CASCADE'),
+    ('todos', 'project_id', 'projects', 'SET NULL'),
+    ('todos', 'parent_todo_id', 'todos', 'CASCADE'),
+    ('projects', 'user_id', 'users', 'CASCADE'),
+    ('files', 'user_id', 'users', 'CASCADE'),
+    ('ai_interactions', 'user_id', 'users', 'CASCADE'),
+    ('ai_interactions', 'todo_id', 'todos', 'CASCADE'),
+    ('chat_conversations', 'user_id', 'users', 'CASCADE'),
+    ('chat_messages', 'conversation_id', 'chat_conversations', 'CASCADE'),
+    ('todos_active', 'user_id', 'users', 'CASCADE'),
+    ('todos_active', 'project_id', 'projects', 'SET NULL'),
+    ('todos_archived', 'user_id', 'users', 'CASCADE'),
+    ('todos_archived', 'project_id', 'projects', 'SET NULL'),
+    ('ai_todo_interactions', 'user_id', 'users', 'CASCADE'),
+)
+
+
+def _replace_foreign_key(table: str, column: str, referred_table: str, ondelete: str) -> None:
+    # Constraint names differ between databases built by Alembic and by the scaling SQL,
+    # so look the existing one up by column instead of assuming a name.
+    op.execute(
+        f"""
+        DO $$
+        DECLARE
+            fk_name TEXT;
+        BEGIN
+            SELECT con.conname INTO fk_name
+            FROM pg_constraint con
+            JOIN pg_attribute att ON att.attrelid = con.conrelid AND att.attnum = ANY (con.conkey)
+            WHERE con.contype = 'f' AND con.conrelid = '{table}'::regclass AND att.attname = '{column}';
+
+            IF fk_name IS NOT NULL THEN
+                EXECUTE format('ALTER TABLE {table} DROP CONSTRAINT %I', fk_name);
+            END IF;
+        END
+        $$
+        """  # noqa: S608 - table/column names come from FOREIGN_KEYS
+    )
+    op.execute(
+        f'ALTER TABLE {table} ADD CONSTRAINT {table}_{column}_fkey '
+        f'FOREIGN KEY ({column}) REFERENCES {referred_table} (id) ON DELETE {ondelete}'
+    )
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # ai_todo_interactions (and on some databases the partitioned tables) come from outside Alembic
+    inspector = sa.inspect(op.get_bind())
+    for table, column, referred_table, ondelete in FOREIGN_KEYS:
+        if not inspector.has_table(table):
+            continue
+        _replace_foreign_key(table, column, referred_table, ondelete)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    inspector = sa.inspect(op.get_bind())
+    for table, column, referred_table, _ondelete in reversed(FOREIGN_KEYS):
+        if not inspector.has_table(table):
+            continue
+        _replace_foreign_key(table, column, referred_table, 'NO ACTION')
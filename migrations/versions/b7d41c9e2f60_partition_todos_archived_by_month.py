@@ -0,0 +1,161 @@
+"""Range-partition todos_archived by archived_at month
+
+Revision ID: b7d41c9e2f60
+Revises: 579f35d64d3c
+Create Date: 2025-10-12 10:15:42.118204
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d41c9e2f60'
+down_revision: str | None = '579f35d64d3c'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Months of partitions to pre-create around the current month.
+MONTHS_BACK = 12
+MONTHS_AHEAD = 3
+
+COLUMNS = (
+    'id, user_id, project_id, parent_todo_id, title, description, status, priority, '
+    'due_date, completed_at, ai_generated, depth, created_at, updated_at, archived_at'
+)
+
+
+def upgrade() -> None:
+    # Declarative partitioning is PostgreSQL-only; SQLite test databases use create_all.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # CREATE TABLE IF NOT EXISTS would keep a plain todos_archived and the PARTITION OF
+    # statements below would then fail; move a plain table aside and copy it back in.
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_class WHERE relname = 'todos_archived' AND relkind = 'p') THEN
+                RETURN;
+            END IF;
+            IF to_regclass('todos_archived') IS NOT NULL THEN
+                ALTER TABLE todos_archived RENAME TO todos_archived_unpartitioned;
+            END IF;
+        END
+        $$
+        """
+    )
+
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS todos_archived (
+            id UUID NOT NULL,
+            user_id UUID NOT NULL REFERENCES users(id),
+            project_id UUID REFERENCES projects(id),
+            parent_todo_id UUID,
+            title VARCHAR(500) NOT NULL,
+            description TEXT,
+            status VARCHAR(20) NOT NULL,
+            priority INTEGER,
+            due_date TIMESTAMPTZ,
+            completed_at TIMESTAMPTZ,
+            ai_generated BOOLEAN,
+            depth INTEGER,
+            created_at TIMESTAMP,
+            updated_at TIMESTAMP,
+            archived_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            PRIMARY KEY (id, archived_at)
+        ) PARTITION BY RANGE (archived_at)
+        """
+    )
+
+    # Idempotent helper used both here and by the scheduled job below.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION create_todos_archived_partition(target_month DATE)
+        RETURNS TEXT AS $$
+        DECLARE
+            month_start DATE := date_trunc('month', target_month)::DATE;
+            partition_name TEXT := 'todos_archived_' || to_char(month_start, 'YYYY_MM');
+        BEGIN
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF todos_archived FOR VALUES FROM (%L) TO (%L)',
+                partition_name,
+                month_start,
+                (month_start + INTERVAL '1 month')::DATE
+            );
+            RETURN partition_name;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+
+    op.execute(
+        f"""
+        SELECT create_todos_archived_partition(
+            (date_trunc('month', now()) + make_interval(months => m))::DATE
+        )
+        FROM generate_series(-{MONTHS_BACK}, {MONTHS_AHEAD}) AS m
+        """  # noqa: S608 - integer month offsets from module constants
+    )
+
+    # Rows older or newer than the pre-created window get their own month's partition first.
+    op.execute(
+        f"""
+        DO $$
+        BEGIN
+            IF to_regclass('todos_archived_unpartitioned') IS NULL THEN
+                RETURN;
+            END IF;
+
+            UPDATE todos_archived_unpartitioned SET archived_at = now() WHERE archived_at IS NULL;
+            PERFORM create_todos_archived_partition(month::DATE)
+            FROM (
+                SELECT DISTINCT date_trunc('month', archived_at) AS month FROM todos_archived_unpartitioned
+            ) AS months;
+
+            INSERT INTO todos_archived ({COLUMNS})
+            SELECT {COLUMNS} FROM todos_archived_unpartitioned;
+            DROP TABLE todos_archived_unpartitioned;
+        END
+        $$
+        """  # noqa: S608 - COLUMNS is a module constant
+    )
+
+    # Keep next month's partition ahead of inserts when pg_cron is available.
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+                PERFORM cron.schedule(
+                    'create-todos-archived-partition',
+                    '0 0 25 * *',
+                    $job$SELECT create_todos_archived_partition((now() + INTERVAL '1 month')::DATE)$job$
+                );
+            END IF;
+        END
+        $$
+        """
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+                PERFORM cron.unschedule('create-todos-archived-partition');
+            END IF;
+        END
+        $$
+        """
+    )
+    op.execute('DROP FUNCTION IF EXISTS create_todos_archived_partition(DATE)')
+    op.execute('DROP TABLE IF EXISTS todos_archived')
@@ -0,0 +1,30 @@
+"""Index todos_active on (user_id, status, due_date)
+
+Revision ID: b8e4f1c9a265
+Revises: a5c19e7d3b28
+Create Date: 2025-10-14 11:48:26.207395
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e4f1c9a265'
+down_revision: str | None = 'a5c19e7d3b28'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Supersedes the (user_id, status) index, which is a prefix of the new one.
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS ix_todos_active_user_status_due ON todos_active (user_id, status, due_date)'
+    )
+    op.execute('DROP INDEX IF EXISTS ix_todos_active_user_id_status')
+
+
+def downgrade() -> None:
+    op.execute('CREATE INDEX IF NOT EXISTS ix_todos_active_user_id_status ON todos_active (user_id, status)')
+    op.execute('DROP INDEX IF EXISTS ix_todos_active_user_status_due')
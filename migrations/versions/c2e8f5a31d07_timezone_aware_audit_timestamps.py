@@ -0,0 +1,59 @@
+"""Make created_at/updated_at timezone-aware with server defaults
+
+Revision ID: c2e8f5a31d07
+Revises: b7d41c9e2f60
+Create Date: 2025-10-12 11:02:17.540913
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2e8f5a31d07'
+down_revision: str | None = 'b7d41c9e2f60'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Tables created with naive audit timestamps. Existing values were written with
+# datetime.utcnow(), so they are interpreted as UTC during the conversion.
+TABLES = ('users', 'projects', 'todos', 'ai_interactions', 'files', 'todos_archived')
+COLUMNS = ('created_at', 'updated_at')
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # files and todos_archived may have been created outside Alembic, or not at all
+    inspector = sa.inspect(op.get_bind())
+    for table in TABLES:
+        if not inspector.has_table(table):
+            continue
+        for column in COLUMNS:
+            op.alter_column(table, column,
+                       existing_type=postgresql.TIMESTAMP(),
+                       type_=sa.DateTime(timezone=True),
+                       postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+                       server_default=sa.text('now()'),
+                       existing_nullable=True)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    inspector = sa.inspect(op.get_bind())
+    for table in TABLES:
+        if not inspector.has_table(table):
+            continue
+        for column in COLUMNS:
+            op.alter_column(table, column,
+                       existing_type=sa.DateTime(timezone=True),
+                       type_=postgresql.TIMESTAMP(),
+                       postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+                       server_default=None,
+                       existing_nullable=True)
@@ -0,0 +1,68 @@
+"""Move scalar column defaults to the database
+
+Revision ID: c6d2a8f4e913
+Revises: b8e4f1c9a265
+Create Date: 2025-10-14 15:33:09.472518
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6d2a8f4e913'
+down_revision: str | None = 'b8e4f1c9a265'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, column, server default, becomes NOT NULL). Existing NULLs are backfilled
+# with the default before the NOT NULL constraint is added.
+DEFAULTS = (
+    ('users', 'is_active', 'true', True),
+    ('todos', 'status', "'todo'", True),
+    ('todos', 'priority', '3', True),
+    ('todos', 'ai_generated', 'false', True),
+    ('todos_active', 'status', "'todo'", False),
+    ('todos_active', 'priority', '3', False),
+    ('todos_active', 'ai_generated', 'false', False),
+    ('todos_active', 'depth', '0', False),
+    ('ai_todo_interactions', 'subtasks_generated', '0', False),
+    ('user_settings', 'theme', "'system'", False),
+    ('user_settings', 'language', "'en'", False),
+    ('user_settings', 'timezone', "'UTC'", False),
+    ('user_settings', 'notifications_enabled', 'true', False),
+    ('user_settings', 'email_notifications', 'true', False),
+    ('user_settings', 'push_notifications', 'true', False),
+)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # user_settings and ai_todo_interactions are created outside Alembic and may be missing
+    inspector = sa.inspect(op.get_bind())
+    for table, column, default, not_null in DEFAULTS:
+        if not inspector.has_table(table):
+            continue
+        if not_null:
+            # Identifiers and values come from DEFAULTS, never from input
+            op.execute(f'UPDATE {table} SET {column} = {default} WHERE {column} IS NULL')  # noqa: S608
+        op.alter_column(table, column,
+                   server_default=sa.text(default),
+                   nullable=False if not_null else None)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    inspector = sa.inspect(op.get_bind())
+    for table, column, _default, not_null in reversed(DEFAULTS):
+        if not inspector.has_table(table):
+            continue
+        op.alter_column(table, column,
+                   server_default=None,
+                   nullable=True if not_null else None)
@@ -0,0 +1,56 @@
+"""Store todo status as a todo_status enum
+
+Revision ID: d3f7b9e1c285
+Revises: c6d2a8f4e913
+Create Date: 2025-10-15 10:04:51.836120
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3f7b9e1c285'
+down_revision: str | None = 'c6d2a8f4e913'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, server default). The enum is 4 bytes per row against up to 12 for the
+# VARCHAR(20) text, and it makes the todos_active check_status constraint redundant.
+TABLES = (
+    ('todos', "'todo'"),
+    ('todos_active', "'todo'"),
+    ('todos_archived', None),
+)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("CREATE TYPE todo_status AS ENUM ('todo', 'in_progress', 'done')")
+    op.execute('ALTER TABLE todos_active DROP CONSTRAINT IF EXISTS check_status')
+
+    for table, default in TABLES:
+        # The text default can't be cast implicitly, so it is re-added after the type change.
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN status DROP DEFAULT')
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN status TYPE todo_status USING status::todo_status')
+        if default:
+            op.execute(f'ALTER TABLE {table} ALTER COLUMN status SET DEFAULT {default}')
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table, default in reversed(TABLES):
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN status DROP DEFAULT')
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN status TYPE VARCHAR(20) USING status::text')
+        if default:
+            op.execute(f'ALTER TABLE {table} ALTER COLUMN status SET DEFAULT {default}')
+
+    op.execute(
+        "ALTER TABLE todos_active ADD CONSTRAINT check_status CHECK (status IN ('todo', 'in_progress', 'done'))"
+    )
+    op.execute('DROP TYPE todo_status')
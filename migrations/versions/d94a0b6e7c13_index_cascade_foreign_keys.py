@@ -0,0 +1,52 @@
+"""Index foreign key columns used by cascade deletes
+
+Revision ID: d94a0b6e7c13
+Revises: c2e8f5a31d07
+Create Date: 2025-10-13 09:41:05.662370
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd94a0b6e7c13'
+down_revision: str | None = 'c2e8f5a31d07'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (index name, table, columns). Without these, every parent delete makes
+# PostgreSQL's FK triggers sequentially scan each child table.
+# IF NOT EXISTS because several of these tables were created outside Alembic; tables
+# no revision creates (todos_active before f3b8d2a6c417, which indexes it itself) are skipped.
+INDEXES = (
+    ('ix_todos_user_id', 'todos', ('user_id',)),
+    ('ix_todos_project_id', 'todos', ('project_id',)),
+    ('ix_todos_parent_todo_id', 'todos', ('parent_todo_id',)),
+    ('ix_projects_user_id', 'projects', ('user_id',)),
+    ('ix_files_user_id', 'files', ('user_id',)),
+    ('ix_files_todo_id', 'files', ('todo_id',)),
+    ('ix_push_subscriptions_user_id', 'push_subscriptions', ('user_id',)),
+    ('ix_ai_interactions_user_id', 'ai_interactions', ('user_id',)),
+    ('ix_ai_interactions_todo_id', 'ai_interactions', ('todo_id',)),
+    ('ix_todos_active_user_id_status', 'todos_active', ('user_id', 'status')),
+    ('ix_todos_active_project_id', 'todos_active', ('project_id',)),
+    ('ix_todos_archived_user_id_status', 'todos_archived', ('user_id', 'status')),
+    ('ix_todos_archived_project_id', 'todos_archived', ('project_id',)),
+    ('ix_ai_todo_interactions_user_id', 'ai_todo_interactions', ('user_id',)),
+)
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for name, table, columns in INDEXES:
+        if not inspector.has_table(table):
+            continue
+        op.execute(f'CREATE INDEX IF NOT EXISTS {name} ON {table} ({", ".join(columns)})')
+
+
+def downgrade() -> None:
+    for name, _table, _columns in reversed(INDEXES):
+        op.execute(f'DROP INDEX IF EXISTS {name}')
@@ -0,0 +1,61 @@
+"""Add retention helper that detaches old todos_archived partitions
+
+Revision ID: e1a7c3d5f902
+Revises: d94a0b6e7c13
+Create Date: 2025-10-13 14:27:51.904316
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1a7c3d5f902'
+down_revision: str | None = 'd94a0b6e7c13'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # Retention drops whole monthly partitions instead of DELETEing archived rows.
+    # Partitions are detached first so the parent is never locked for the drop.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION detach_old_todos_archived_partitions(retention_months INTEGER)
+        RETURNS INTEGER AS $$
+        DECLARE
+            cutoff TEXT := 'todos_archived_' || to_char(
+                date_trunc('month', now()) - make_interval(months => retention_months), 'YYYY_MM'
+            );
+            partition_name TEXT;
+            dropped INTEGER := 0;
+        BEGIN
+            FOR partition_name IN
+                SELECT child.relname
+                FROM pg_inherits
+                JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+                JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                WHERE parent.relname = 'todos_archived'
+                  AND child.relname ~ '^todos_archived_[0-9]{4}_[0-9]{2}$'
+                  AND child.relname < cutoff
+            LOOP
+                EXECUTE format('ALTER TABLE todos_archived DETACH PARTITION %I', partition_name);
+                EXECUTE format('DROP TABLE %I', partition_name);
+                dropped := dropped + 1;
+            END LOOP;
+            RETURN dropped;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('DROP FUNCTION IF EXISTS detach_old_todos_archived_partitions(INTEGER)')
@@ -0,0 +1,69 @@
+"""Index push subscriptions by a 64-bit endpoint hash
+
+Revision ID: e5a9c1d7f346
+Revises: d3f7b9e1c285
+Create Date: 2025-10-15 14:27:03.619204
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a9c1d7f346'
+down_revision: str | None = 'd3f7b9e1c285'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# First 8 bytes of the SHA-256 as a signed BIGINT, the same value as models.push_subscription.hash_endpoint.
+ENDPOINT_HASH = "('x' || substr(encode(sha256(convert_to(endpoint, 'UTF8')), 'hex'), 1, 16))::bit(64)::bigint"
+
+
+def _drop_endpoint_unique_constraint() -> None:
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            uq_name TEXT;
+        BEGIN
+            SELECT con.conname INTO uq_name
+            FROM pg_constraint con
+            JOIN pg_attribute att ON att.attrelid = con.conrelid AND att.attnum = ANY (con.conkey)
+            WHERE con.contype = 'u' AND con.conrelid = 'push_subscriptions'::regclass AND att.attname = 'endpoint';
+
+            IF uq_name IS NOT NULL THEN
+                EXECUTE format('ALTER TABLE push_subscriptions DROP CONSTRAINT %I', uq_name);
+            END IF;
+        END
+        $$
+        """
+    )
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    # push_subscriptions is created outside Alembic
+    if not sa.inspect(op.get_bind()).has_table('push_subscriptions'):
+        return
+
+    op.execute('ALTER TABLE push_subscriptions ADD COLUMN endpoint_hash BIGINT')
+    op.execute(f'UPDATE push_subscriptions SET endpoint_hash = {ENDPOINT_HASH}')  # noqa: S608 - fixed SQL expression
+    op.execute('ALTER TABLE push_subscriptions ALTER COLUMN endpoint_hash SET NOT NULL')
+    op.execute(
+        'ALTER TABLE push_subscriptions ADD CONSTRAINT push_subscriptions_endpoint_hash_key UNIQUE (endpoint_hash)'
+    )
+    # The unique index on the full URL text is what the hash replaces.
+    _drop_endpoint_unique_constraint()
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    if not sa.inspect(op.get_bind()).has_table('push_subscriptions'):
+        return
+
+    op.execute('ALTER TABLE push_subscriptions ADD CONSTRAINT push_subscriptions_endpoint_key UNIQUE (endpoint)')
+    op.execute('ALTER TABLE push_subscriptions DROP COLUMN endpoint_hash')
@@ -0,0 +1,94 @@
+"""Hash-partition todos_active by user_id
+
+Revision ID: f3b8d2a6c417
+Revises: e1a7c3d5f902
+Create Date: 2025-10-13 16:05:12.337481
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b8d2a6c417'
+down_revision: str | None = 'e1a7c3d5f902'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+PARTITIONS = 16
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # Databases built from the scaling SQL already have todos_active hash-partitioned
+    # (relkind 'p'); a plain table is rebuilt, copying its rows across, and a database
+    # that never had one gets the partitioned table from scratch.
+    op.execute(
+        f"""
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_class WHERE relname = 'todos_active' AND relkind = 'p') THEN
+                RETURN;
+            END IF;
+
+            IF to_regclass('todos_active') IS NULL THEN
+                CREATE TABLE todos_active (
+                    id UUID NOT NULL,
+                    user_id UUID NOT NULL,
+                    project_id UUID,
+                    parent_todo_id UUID,
+                    title VARCHAR(500) NOT NULL,
+                    description TEXT,
+                    status VARCHAR(20) DEFAULT 'todo',
+                    priority INTEGER DEFAULT 3,
+                    due_date TIMESTAMPTZ,
+                    completed_at TIMESTAMPTZ,
+                    ai_generated BOOLEAN DEFAULT false,
+                    depth INTEGER DEFAULT 0,
+                    created_at TIMESTAMPTZ DEFAULT now(),
+                    updated_at TIMESTAMPTZ DEFAULT now(),
+                    PRIMARY KEY (id, user_id),
+                    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+                    FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE SET NULL,
+                    CONSTRAINT check_status CHECK (status IN ('todo', 'in_progress', 'done')),
+                    CONSTRAINT check_priority CHECK (priority BETWEEN 1 AND 5),
+                    CONSTRAINT check_max_depth CHECK (depth <= 10)
+                ) PARTITION BY HASH (user_id);
+            ELSE
+                ALTER TABLE todos_active RENAME TO todos_active_unpartitioned;
+
+                CREATE TABLE todos_active (
+                    LIKE todos_active_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS,
+                    PRIMARY KEY (id, user_id),
+                    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+                    FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE SET NULL
+                ) PARTITION BY HASH (user_id);
+            END IF;
+
+            FOR remainder IN 0..{PARTITIONS - 1} LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF todos_active FOR VALUES WITH (MODULUS {PARTITIONS}, REMAINDER %s)',
+                    'todos_active_part_' || lpad(remainder::TEXT, 2, '0'),
+                    remainder
+                );
+            END LOOP;
+
+            IF to_regclass('todos_active_unpartitioned') IS NOT NULL THEN
+                INSERT INTO todos_active SELECT * FROM todos_active_unpartitioned;
+                DROP TABLE todos_active_unpartitioned;
+            END IF;
+
+            CREATE INDEX ix_todos_active_user_id_status ON todos_active (user_id, status);
+            CREATE INDEX ix_todos_active_project_id ON todos_active (project_id);
+        END
+        $$
+        """  # noqa: S608 - only PARTITIONS, an int constant, is interpolated
+    )
+
+
+def downgrade() -> None:
+    # One-way: un-partitioning would rewrite the table for no benefit.
+    pass
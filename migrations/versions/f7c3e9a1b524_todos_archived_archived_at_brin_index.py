@@ -0,0 +1,35 @@
+"""Add a BRIN index on todos_archived.archived_at
+
+Revision ID: f7c3e9a1b524
+Revises: e5a9c1d7f346
+Create Date: 2025-10-15 16:52:38.104927
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7c3e9a1b524'
+down_revision: str | None = 'e5a9c1d7f346'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # Created on the partitioned parent, so every monthly partition gets its own summary.
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS ix_todos_archived_archived_at_brin ON todos_archived '
+        'USING BRIN (archived_at) WITH (pages_per_range = 32)'
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('DROP INDEX IF EXISTS ix_todos_archived_archived_at_brin')
@@ -2,6 +2,8 @@
 Models package initialization.
 """
 
+from sqlalchemy.orm import configure_mappers
+
 from .ai_interaction import AIInteraction
 from .base import Base, BaseModel
 from .chat_conversation import ChatConversation
@@ -16,6 +18,10 @@ from .todo_partitioned import AITodoInteraction, TodoActive, TodoArchived
 from .user import User
 from .user_settings import UserSettings
 
+# Resolve every string-based relationship now, so a broken reference fails at import
+# and the first request doesn't pay for mapper configuration.
+configure_mappers()
+
 __all__ = [
     "Base",
     "BaseModel",
@@ -15,8 +15,8 @@ class AIInteraction(BaseModel):
 
     __tablename__ = "ai_interactions"
 
-    user_id = Column(UUID(), ForeignKey("users.id"), nullable=False)
-    todo_id = Column(UUID(), ForeignKey("todos.id"))
+    user_id = Column(UUID(), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    todo_id = Column(UUID(), ForeignKey("todos.id", ondelete="CASCADE"), index=True)
     prompt = Column(Text, nullable=False)
     response = Column(Text, nullable=False)
     interaction_type = Column(String(50))  # subtask_generation, file_analysis, etc.
@@ -3,14 +3,16 @@ Defines a base model for SQLAlchemy ORM with common attributes.
 
 This module provides a base class for SQLAlchemy models, including standard
 attributes for identifying and timestamping database records. It uses PostgreSQL's
-UUID type for primary key generation and automatically manages timestamps for
-creation and updates.
+UUID type with time-ordered (version 7) primary keys and automatically manages
+timestamps for creation and updates.
 """
 
+import os
+import time
 import uuid
-from datetime import datetime
+from datetime import UTC, datetime
 
-from sqlalchemy import Column, DateTime, String, TypeDecorator
+from sqlalchemy import Column, DateTime, String, TypeDecorator, func
 from sqlalchemy.dialects.postgresql import UUID as PostgreSQLUUID
 from sqlalchemy.ext.declarative import declarative_base
 
@@ -53,6 +55,25 @@ class UUID(TypeDecorator):
             return value
 
 
+def _utcnow() -> datetime:
+    """Return the current time as a timezone-aware UTC datetime."""
+    return datetime.now(UTC)
+
+
+def _uuid7() -> uuid.UUID:
+    """
+    Return a time-ordered version 7 UUID (RFC 9562).
+
+    The leading 48 bits are the Unix time in milliseconds, so new primary keys land
+    at the right edge of the B-tree instead of on a random leaf page.
+    """
+    unix_ts_ms = time.time_ns() // 1_000_000
+    value = (unix_ts_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # variant
+    return uuid.UUID(int=value)
+
+
 class BaseModel(Base):
     """
     Base model class for database entities.
@@ -61,6 +82,10 @@ class BaseModel(Base):
     entities, providing standard fields for consistent identification and
     tracking of record creation and modification timestamps.
 
+    Relationships on subclasses are eager-loaded per query: one-to-many collections
+    with selectinload(), since joinedload() would repeat the parent row for every
+    child, and many-to-one references with joinedload().
+
     :ivar id: Unique identifier for the record.
     :type id: UUID
     :ivar created_at: Timestamp representing when the record was created.
@@ -71,6 +96,6 @@ class BaseModel(Base):
 
     __abstract__ = True
 
-    id = Column(UUID(), primary_key=True, default=uuid.uuid4)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    id = Column(UUID(), primary_key=True, default=_uuid7)
+    created_at = Column(DateTime(timezone=True), default=_utcnow, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), default=_utcnow, onupdate=_utcnow, server_default=func.now())
@@ -15,7 +15,7 @@ class ChatConversation(BaseModel):
 
     __tablename__ = "chat_conversations"
 
-    user_id = Column(UUID(), ForeignKey("users.id"), nullable=False)
+    user_id = Column(UUID(), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     title = Column(String(255), nullable=True)  # Auto-generated from first message
     summary = Column(Text, nullable=True)  # AI-generated summary of conversation
 
@@ -25,5 +25,6 @@ class ChatConversation(BaseModel):
         "ChatMessage",
         back_populates="conversation",
         cascade="all, delete-orphan",
+        passive_deletes=True,
         order_by="ChatMessage.created_at",
     )
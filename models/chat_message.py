@@ -25,7 +25,7 @@ class ChatMessage(BaseModel):
 
     __tablename__ = "chat_messages"
 
-    conversation_id = Column(UUID(), ForeignKey("chat_conversations.id"), nullable=False)
+    conversation_id = Column(UUID(), ForeignKey("chat_conversations.id", ondelete="CASCADE"), nullable=False)
     role = Column(Enum(MessageRole), nullable=False)
     content = Column(Text, nullable=False)
 
@@ -15,10 +15,10 @@ class File(BaseModel):
 
     __tablename__ = "files"
 
-    user_id = Column(UUID(), ForeignKey("users.id"), nullable=False)
+    user_id = Column(UUID(), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     # Note: todo_id is not a direct foreign key anymore due to partitioning
     # We'll handle the relationship through application logic
-    todo_id = Column(UUID())  # Removed ForeignKey constraint
+    todo_id = Column(UUID(), index=True)  # Removed ForeignKey constraint
     filename = Column(String(255), nullable=False)
     file_path = Column(String(500), nullable=False)
     file_size = Column(Integer)
@@ -15,16 +15,18 @@ class Project(BaseModel):
 
     __tablename__ = "projects"
 
-    user_id = Column(UUID(), ForeignKey("users.id"), nullable=False)
+    user_id = Column(UUID(), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String(255), nullable=False)
     description = Column(Text)
 
     # Relationships
-    user = relationship("User", back_populates="projects")
+    user = relationship("User", back_populates="projects", lazy="raise_on_sql")
 
+    # Deleting a project keeps its todos: every project_id FK is ON DELETE SET NULL,
+    # so none of these cascade deletes and the database unassigns the rows
     # Keep original todos relationship for backward compatibility during migration
-    todos = relationship("Todo", back_populates="project", cascade="all, delete-orphan")
+    todos = relationship("Todo", back_populates="project", passive_deletes=True)
 
     # New partitioned relationships
-    active_todos = relationship("TodoActive", back_populates="project", cascade="all, delete-orphan")
-    archived_todos = relationship("TodoArchived", back_populates="project", cascade="all, delete-orphan")
+    active_todos = relationship("TodoActive", back_populates="project", passive_deletes=True)
+    archived_todos = relationship("TodoArchived", back_populates="project", passive_deletes=True)
@@ -5,12 +5,19 @@ This module defines the PushSubscription model which manages user subscriptions
 to web push notifications for browser-based notifications.
 """
 
-from sqlalchemy import Column, ForeignKey, String, Text
-from sqlalchemy.orm import relationship
+import hashlib
+
+from sqlalchemy import BigInteger, Column, ForeignKey, String, Text, and_
+from sqlalchemy.orm import relationship, validates
 
 from .base import UUID, BaseModel
 
 
+def hash_endpoint(endpoint: str) -> int:
+    """Return a stable signed 64-bit hash of a push endpoint URL (first 8 bytes of its SHA-256)."""
+    return int.from_bytes(hashlib.sha256(endpoint.encode()).digest()[:8], "big", signed=True)
+
+
 class PushSubscription(BaseModel):
     """
     Represents a push notification subscription for a user.
@@ -22,6 +29,8 @@ class PushSubscription(BaseModel):
     :type user_id: UUID
     :ivar endpoint: Push service endpoint URL.
     :type endpoint: str
+    :ivar endpoint_hash: 64-bit hash of the endpoint, carrying the unique index.
+    :type endpoint_hash: int
     :ivar p256dh_key: User's public key for encryption (p256dh).
     :type p256dh_key: str
     :ivar auth_key: Authentication secret for the subscription.
@@ -33,10 +42,12 @@ class PushSubscription(BaseModel):
     __tablename__ = "push_subscriptions"
 
     # Foreign key to user
-    user_id = Column(UUID(), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(UUID(), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
 
     # Push subscription details
-    endpoint = Column(Text, nullable=False, unique=True)
+    # Uniqueness and lookups go through the 8-byte hash instead of a B-tree over the full URL
+    endpoint = Column(Text, nullable=False)
+    endpoint_hash = Column(BigInteger, nullable=False, unique=True)
     p256dh_key = Column(String(255), nullable=False)  # Public key for encryption
     auth_key = Column(String(255), nullable=False)  # Authentication secret
 
@@ -45,3 +56,13 @@ class PushSubscription(BaseModel):
 
     # Relationship
     user = relationship("User", back_populates="push_subscriptions")
+
+    @validates("endpoint")
+    def _set_endpoint_hash(self, _key, endpoint):
+        self.endpoint_hash = hash_endpoint(endpoint)
+        return endpoint
+
+    @classmethod
+    def endpoint_matches(cls, endpoint: str):
+        """Filter for one endpoint: the indexed hash, then the URL itself to rule out collisions."""
+        return and_(cls.endpoint_hash == hash_endpoint(endpoint), cls.endpoint == endpoint)
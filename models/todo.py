@@ -9,7 +9,7 @@ Classes:
     Todo: Represents a todo item with hierarchical structure and AI capabilities.
 """
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, Integer, String, Text, false
 from sqlalchemy.orm import backref, relationship
 
 from .base import UUID, BaseModel
@@ -45,32 +45,34 @@ class Todo(BaseModel):
 
     __tablename__ = "todos"
 
-    user_id = Column(UUID(), ForeignKey("users.id"), nullable=False)
-    project_id = Column(UUID(), ForeignKey("projects.id"))
-    parent_todo_id = Column(UUID(), ForeignKey("todos.id"))
+    user_id = Column(UUID(), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    project_id = Column(UUID(), ForeignKey("projects.id", ondelete="SET NULL"), index=True)
+    parent_todo_id = Column(UUID(), ForeignKey("todos.id", ondelete="CASCADE"), index=True)
 
     title = Column(String(500), nullable=False)
     description = Column(Text)
-    status = Column(String(20), default="todo")  # todo, in_progress, done
-    priority = Column(Integer, default=3)  # 1-5 scale
+    status = Column(Enum("todo", "in_progress", "done", name="todo_status"), server_default="todo", nullable=False)
+    priority = Column(Integer, server_default="3", nullable=False)  # 1-5 scale
     due_date = Column(DateTime(timezone=True))
     completed_at = Column(DateTime(timezone=True))
-    ai_generated = Column(Boolean, default=False)
+    ai_generated = Column(Boolean, server_default=false(), nullable=False)
 
     # Relationships
-    user = relationship("User", back_populates="todos")
-    project = relationship("Project", back_populates="todos")
+    # Many-to-one lazy loads raise instead of emitting SQL; eager-load them (e.g. joinedload(Todo.project)).
+    user = relationship("User", back_populates="todos", lazy="raise_on_sql")
+    project = relationship("Project", back_populates="todos", lazy="raise_on_sql")
     subtasks = relationship(
         "Todo",
         backref=backref("parent", remote_side="Todo.id"),
         foreign_keys=[parent_todo_id],
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     # Note: files relationship removed due to partitioned structure migration
 
     def __repr__(self) -> str:
         """String representation of the Todo."""
-        return f"<Todo(id={self.id}, title='{self.title[:30]}...', status='{self.status}')>"
+        return f"<Todo(id={self.id}, status='{self.status}')>"
 
     def is_completed(self) -> bool:
         """Check if the todo is completed."""
@@ -18,19 +18,28 @@ Classes:
 import uuid
 
 from sqlalchemy import (
+    DDL,
     Boolean,
     CheckConstraint,
     Column,
     DateTime,
+    Enum,
     ForeignKey,
+    Index,
     Integer,
+    PrimaryKeyConstraint,
     String,
     Text,
+    event,
+    false,
 )
-from sqlalchemy.orm import backref, relationship
+from sqlalchemy.orm import backref, deferred, relationship
 from sqlalchemy.sql import func
 
-from .base import UUID, BaseModel
+from .base import UUID, BaseModel, _utcnow
+
+# Hash partitions of todos_active; must match PARTITIONS in migration f3b8d2a6c417
+TODOS_ACTIVE_PARTITIONS = 16
 
 
 class TodoActive(BaseModel):
@@ -38,10 +47,12 @@ class TodoActive(BaseModel):
     Active todos model for partitioned table (status: todo, in_progress).
 
     This model represents todos that are currently being worked on.
-    Partitioned by user_id for optimal query performance with hash partitioning.
+    Hash-partitioned by user_id into 16 child tables, so user-scoped queries are
+    pruned to a single partition. The partition key is part of the composite
+    (id, user_id) primary key; always filter on user_id.
 
     Attributes:
-        user_id: Foreign key to User (partition key)
+        user_id: Foreign key to User (partition key, part of primary key)
         project_id: Optional foreign key to associated Project
         parent_todo_id: Optional foreign key for hierarchical structure
         title: Todo title (required, max 500 chars)
@@ -62,18 +73,18 @@ class TodoActive(BaseModel):
 
     __tablename__ = "todos_active"
 
-    user_id = Column(UUID(), ForeignKey("users.id"), nullable=False)
-    project_id = Column(UUID(), ForeignKey("projects.id"))
+    user_id = Column(UUID(), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True, nullable=False)
+    project_id = Column(UUID(), ForeignKey("projects.id", ondelete="SET NULL"))
     parent_todo_id = Column(UUID())  # Self-reference within same partition
 
     title = Column(String(500), nullable=False)
     description = Column(Text)
-    status = Column(String(20), default="todo")
-    priority = Column(Integer, default=3)
+    status = Column(Enum("todo", "in_progress", "done", name="todo_status"), server_default="todo")
+    priority = Column(Integer, server_default="3")
     due_date = Column(DateTime(timezone=True))
     completed_at = Column(DateTime(timezone=True))
-    ai_generated = Column(Boolean, default=False)
-    depth = Column(Integer, default=0)  # New field for hierarchy depth
+    ai_generated = Column(Boolean, server_default=false())
+    depth = Column(Integer, server_default="0")  # New field for hierarchy depth
 
     # Relationships
     user = relationship("User", back_populates="active_todos")
@@ -82,18 +93,22 @@ class TodoActive(BaseModel):
 
     # Table constraints
     __table_args__ = (
-        CheckConstraint("status IN ('todo', 'in_progress', 'done')", name="check_status"),
+        PrimaryKeyConstraint("id", "user_id"),
+        # Serves the per-user list/filter path: WHERE user_id AND status, ranged or sorted by due_date
+        Index("ix_todos_active_user_status_due", "user_id", "status", "due_date"),
+        Index("ix_todos_active_project_id", "project_id"),
         CheckConstraint("priority BETWEEN 1 AND 5", name="check_priority"),
         CheckConstraint("depth <= 10", name="check_max_depth"),
         CheckConstraint(
             "(status = 'done' AND completed_at IS NOT NULL) OR (status != 'done')",
             name="check_completed_at_when_done",
         ),
-        {"extend_existing": True},
+        {"postgresql_partition_by": "HASH (user_id)", "extend_existing": True},
     )
 
     def __repr__(self) -> str:
-        return f"<TodoActive(id={self.id}, title='{self.title[:30]}...', status='{self.status}')>"
+        # Identify by primary key only; slicing the title here is wasted work on every log/debug render.
+        return f"<TodoActive(id={self.id}, status='{self.status}')>"
 
     def is_completed(self) -> bool:
         """Check if the todo is completed."""
@@ -110,12 +125,27 @@ class TodoActive(BaseModel):
         return self.depth < 10
 
 
+# create_all only builds the partitioned parent, which rejects every insert until partitions exist
+for _remainder in range(TODOS_ACTIVE_PARTITIONS):
+    event.listen(
+        TodoActive.__table__,
+        "after_create",
+        DDL(
+            f"CREATE TABLE todos_active_part_{_remainder:02d} PARTITION OF todos_active "
+            f"FOR VALUES WITH (MODULUS {TODOS_ACTIVE_PARTITIONS}, REMAINDER {_remainder})"
+        ).execute_if(dialect="postgresql"),
+    )
+
+
 class TodoArchived(BaseModel):
     """
     Archived todos model for completed todos.
 
     This model stores completed todos that have been archived.
-    Partitioned by archived_at date for efficient time-based queries.
+    Range-partitioned by archived_at into monthly child tables, so retention is a
+    DROP of an old partition and queries bounded on archived_at only scan the
+    matching months. PostgreSQL requires the partition key to be part of the
+    primary key, hence the composite (id, archived_at) key.
 
     Attributes:
         user_id: Foreign key to User
@@ -138,30 +168,56 @@ class TodoArchived(BaseModel):
 
     __tablename__ = "todos_archived"
 
-    user_id = Column(UUID(), ForeignKey("users.id"), nullable=False)
-    project_id = Column(UUID(), ForeignKey("projects.id"))
+    user_id = Column(UUID(), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    project_id = Column(UUID(), ForeignKey("projects.id", ondelete="SET NULL"))
     parent_todo_id = Column(UUID())  # Reference to archived parent
 
     title = Column(String(500), nullable=False)
     description = Column(Text)
-    status = Column(String(20), nullable=False)
+    status = Column(Enum("todo", "in_progress", "done", name="todo_status"), nullable=False)
     priority = Column(Integer)
     due_date = Column(DateTime(timezone=True))
     completed_at = Column(DateTime(timezone=True))
     ai_generated = Column(Boolean)
     depth = Column(Integer)
 
-    archived_at = Column(DateTime(timezone=True), default=func.now())
+    archived_at = Column(
+        DateTime(timezone=True),
+        primary_key=True,
+        nullable=False,
+        default=_utcnow,
+        server_default=func.now(),
+    )
 
     # Relationships
     user = relationship("User", back_populates="archived_todos")
     project = relationship("Project", back_populates="archived_todos")
 
     # Table configuration
-    __table_args__ = ({"extend_existing": True},)
+    __table_args__ = (
+        PrimaryKeyConstraint("id", "archived_at"),
+        Index("ix_todos_archived_user_id_status", "user_id", "status"),
+        Index("ix_todos_archived_project_id", "project_id"),
+        # Rows arrive in archived_at order, so a BRIN summary prunes date ranges at a fraction of a B-tree's size
+        Index(
+            "ix_todos_archived_archived_at_brin",
+            "archived_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        {"postgresql_partition_by": "RANGE (archived_at)", "extend_existing": True},
+    )
 
     def __repr__(self) -> str:
-        return f"<TodoArchived(id={self.id}, title='{self.title[:30]}...', archived_at='{self.archived_at}')>"
+        return f"<TodoArchived(id={self.id}, status='{self.status}')>"
+
+
+# Outside Alembic no monthly partitions exist, so give create_all-built databases a catch-all one
+event.listen(
+    TodoArchived.__table__,
+    "after_create",
+    DDL("CREATE TABLE todos_archived_default PARTITION OF todos_archived DEFAULT").execute_if(dialect="postgresql"),
+)
 
 
 class AITodoInteraction(BaseModel):
@@ -175,8 +231,8 @@ class AITodoInteraction(BaseModel):
         todo_id: Reference to the todo this interaction is about
         user_id: Foreign key to User (partition key)
         interaction_type: Type of AI interaction (generate_subtasks, analyze, etc.)
-        prompt: The prompt sent to AI
-        response: The AI response
+        prompt: The prompt sent to AI (deferred)
+        response: The AI response (deferred)
         subtasks_generated: Number of subtasks generated
         model_used: AI model that was used
 
@@ -188,11 +244,12 @@ class AITodoInteraction(BaseModel):
     __tablename__ = "ai_todo_interactions"
 
     todo_id = Column(UUID(), nullable=False)
-    user_id = Column(UUID(), ForeignKey("users.id"), nullable=False)
+    user_id = Column(UUID(), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     interaction_type = Column(String(50), nullable=False)
-    prompt = Column(Text, nullable=False)
-    response = Column(Text, nullable=False)
-    subtasks_generated = Column(Integer, default=0)
+    # Large TEXT payloads only needed on detail views; load with undefer_group("body")
+    prompt = deferred(Column(Text, nullable=False), group="body")
+    response = deferred(Column(Text, nullable=False), group="body")
+    subtasks_generated = Column(Integer, server_default="0")
     model_used = Column(String(100))
 
     # Relationships
@@ -30,7 +30,7 @@ files : sqlalchemy.orm.relationship
     cascading deletes for related objects.
 """
 
-from sqlalchemy import Boolean, Column, String
+from sqlalchemy import Boolean, Column, String, true
 from sqlalchemy.orm import relationship
 
 from .base import BaseModel
@@ -60,20 +60,31 @@ class User(BaseModel):
     clerk_user_id = Column(String(255), unique=True, nullable=False)
     email = Column(String(255), nullable=False, unique=True)
     username = Column(String(100))
-    is_active = Column(Boolean, default=True)
+    is_active = Column(Boolean, server_default=true(), nullable=False)
 
     # Relationships
+    # Every child FK is ON DELETE CASCADE, so deleting a user leaves the children to the database
     # Keep original todos relationship for backward compatibility during migration
-    todos = relationship("Todo", back_populates="user", cascade="all, delete-orphan")
+    todos = relationship("Todo", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
 
     # New partitioned relationships
-    active_todos = relationship("TodoActive", back_populates="user", cascade="all, delete-orphan")
-    archived_todos = relationship("TodoArchived", back_populates="user", cascade="all, delete-orphan")
-    ai_interactions = relationship("AITodoInteraction", back_populates="user", cascade="all, delete-orphan")
+    active_todos = relationship("TodoActive", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    archived_todos = relationship(
+        "TodoArchived", back_populates="user", cascade="all, delete-orphan", passive_deletes=True
+    )
+    ai_interactions = relationship(
+        "AITodoInteraction", back_populates="user", cascade="all, delete-orphan", passive_deletes=True
+    )
 
     # Other relationships
-    projects = relationship("Project", back_populates="user", cascade="all, delete-orphan")
-    files = relationship("File", back_populates="user", cascade="all, delete-orphan")
-    settings = relationship("UserSettings", back_populates="user", cascade="all, delete-orphan", uselist=False)
-    chat_conversations = relationship("ChatConversation", back_populates="user", cascade="all, delete-orphan")
-    push_subscriptions = relationship("PushSubscription", back_populates="user", cascade="all, delete-orphan")
+    projects = relationship("Project", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    files = relationship("File", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    settings = relationship(
+        "UserSettings", back_populates="user", cascade="all, delete-orphan", passive_deletes=True, uselist=False
+    )
+    chat_conversations = relationship(
+        "ChatConversation", back_populates="user", cascade="all, delete-orphan", passive_deletes=True
+    )
+    push_subscriptions = relationship(
+        "PushSubscription", back_populates="user", cascade="all, delete-orphan", passive_deletes=True
+    )
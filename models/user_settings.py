@@ -5,7 +5,7 @@ This module defines the UserSettings model which manages user-specific
 preferences including theme, language, timezone, and notification settings.
 """
 
-from sqlalchemy import Boolean, Column, Enum, ForeignKey, String
+from sqlalchemy import Boolean, Column, Enum, ForeignKey, String, true
 from sqlalchemy.orm import relationship
 
 from .base import UUID, BaseModel
@@ -43,18 +43,18 @@ class UserSettings(BaseModel):
     # Theme settings
     theme = Column(
         Enum("light", "dark", "system", name="theme_type"),
-        default="system",
+        server_default="system",
         nullable=False,
     )
 
     # Localization settings
-    language = Column(String(10), default="en", nullable=False)
-    timezone = Column(String(50), default="UTC", nullable=False)
+    language = Column(String(10), server_default="en", nullable=False)
+    timezone = Column(String(50), server_default="UTC", nullable=False)
 
     # Notification preferences
-    notifications_enabled = Column(Boolean, default=True, nullable=False)
-    email_notifications = Column(Boolean, default=True, nullable=False)
-    push_notifications = Column(Boolean, default=True, nullable=False)
+    notifications_enabled = Column(Boolean, server_default=true(), nullable=False)
+    email_notifications = Column(Boolean, server_default=true(), nullable=False)
+    push_notifications = Column(Boolean, server_default=true(), nullable=False)
 
     # Relationship
     user = relationship("User", back_populates="settings")
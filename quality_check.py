@@ -11,53 +11,70 @@ For CI/CD integration, run: python quality_check.py
 For legacy toolchain: python quality_check_traditional.py
 """
 
-import subprocess
+import asyncio
+import re
 import sys
 from pathlib import Path
 
+_PYLINT_SCORE_RE = re.compile(r"rated at ([\d.]+)/10")
 
-def run_command(cmd: list[str], description: str, is_pylint: bool = False) -> bool:
+
+async def run_command(cmd: list[str], description: str, is_pylint: bool = False) -> bool:
     """Run a command and return True if successful."""
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        stdout_bytes, stderr_bytes = await process.communicate()
+    except Exception as e:
+        print(f"💥 Error running {description}: {e}")
+        return False
+
+    stdout = stdout_bytes.decode(errors="replace")
+    stderr = stderr_bytes.decode(errors="replace")
+
+    # Report only once the command has finished so concurrent checks don't interleave
     print(f"\n{'='*60}")
     print(f"🔍 {description}")
     print(f"Command: {' '.join(cmd)}")
     print("=" * 60)
 
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-
-        if result.stdout:
-            print("STDOUT:", result.stdout)
-        if result.stderr:
-            print("STDERR:", result.stderr)
-
-        # Special handling for pylint - check score instead of exit code
-        if is_pylint and result.stdout:
-            import re
-
-            score_match = re.search(r"rated at ([\d.]+)/10", result.stdout)
-            if score_match:
-                score = float(score_match.group(1))
-                print(f"Pylint Score: {score}/10")
-                if score >= 9.5:
-                    print(f"✅ {description} - PASSED (Score: {score}/10)")
-                    return True
-                else:
-                    print(f"⚠️ {description} - LOW SCORE (Score: {score}/10, minimum: 9.5)")
-                    return False
-
-        if result.returncode == 0:
-            print(f"✅ {description} - PASSED")
-            return True
-        else:
-            print(f"❌ {description} - FAILED (exit code: {result.returncode})")
-            return False
-
-    except Exception as e:
-        print(f"💥 Error running {description}: {e}")
+    if stdout:
+        print("STDOUT:", stdout)
+    if stderr:
+        print("STDERR:", stderr)
+
+    # Special handling for pylint - check score instead of exit code
+    if is_pylint and stdout:
+        score_match = _PYLINT_SCORE_RE.search(stdout)
+        if score_match:
+            score = float(score_match.group(1))
+            print(f"Pylint Score: {score}/10")
+            if score >= 9.5:
+                print(f"✅ {description} - PASSED (Score: {score}/10)")
+                return True
+            else:
+                print(f"⚠️ {description} - LOW SCORE (Score: {score}/10, minimum: 9.5)")
+                return False
+
+    if process.returncode == 0:
+        print(f"✅ {description} - PASSED")
+        return True
+    else:
+        print(f"❌ {description} - FAILED (exit code: {process.returncode})")
         return False
 
 
+async def run_checks(fix_check: tuple[list[str], str, bool], checks: list[tuple[list[str], str, bool]]) -> list[bool]:
+    """Run the auto-fixing check first, then the read-only checks concurrently."""
+    # Ruff --fix rewrites files, so it has to finish before anything else reads them
+    fixed = await run_command(*fix_check)
+    checked = await asyncio.gather(
+        *(run_command(cmd, description, is_pylint) for cmd, description, is_pylint in checks)
+    )
+    return [fixed, *checked]
+
+
 def main():
     """Run all quality checks using modern toolchain."""
     print("🚀 Running TodoList Backend Quality Checks (Modern Toolchain)")
@@ -67,12 +84,12 @@ def main():
     project_root = Path(__file__).parent
     print(f"Project root: {project_root}")
 
+    fix_check = (
+        ["ruff", "check", "app/", "tests/", "--fix"],
+        "Ruff - Import sorting and linting (with auto-fix)",
+        False,
+    )
     checks = [
-        (
-            ["ruff", "check", "app/", "tests/", "--fix"],
-            "Ruff - Import sorting and linting (with auto-fix)",
-            False,
-        ),
         (["python", "-m", "black", ".", "--check"], "Black - Code formatting check", False),
         (
             ["python", "-m", "pylint", "app/", "--score=y"],
@@ -83,11 +100,10 @@ def main():
 
     # Modern toolchain: Ruff replaces isort + flake8 for better performance
 
-    results = []
-
-    for cmd, description, is_pylint in checks:
-        success = run_command(cmd, description, is_pylint)
-        results.append((description, success))
+    outcomes = asyncio.run(run_checks(fix_check, checks))
+    results = [
+        (description, success) for (_, description, _), success in zip([fix_check, *checks], outcomes, strict=True)
+    ]
 
     # Summary
     print(f"\n{'='*60}")
@@ -7,6 +7,7 @@ with appropriate configurations and options.
 """
 
 import argparse
+import importlib.util
 import os
 import subprocess
 import sys
@@ -96,37 +97,19 @@ def run_e2e_tests(verbose=False):
 
 
 def run_all_tests(verbose=False, coverage=True):
-    """Run all tests in sequence."""
-    total_failures = 0
+    """Run all test suites in a single pytest process."""
+    # One process pays interpreter, plugin and conftest startup once instead of once per suite
+    cmd = ["python", "-m", "pytest", "tests/", "-m", "unit or integration or api or e2e"]
 
-    # Run tests in logical order
-    test_suites = [
-        ("Unit Tests", lambda: run_unit_tests(verbose, coverage)),
-        ("Integration Tests", lambda: run_integration_tests(verbose)),
-        ("API Tests", lambda: run_api_tests(verbose)),
-        ("End-to-End Tests", lambda: run_e2e_tests(verbose)),
-    ]
-
-    results = []
-
-    for suite_name, test_func in test_suites:
-        exit_code = test_func()
-        results.append((suite_name, exit_code))
-        if exit_code != 0:
-            total_failures += 1
-
-    # Print summary
-    print(f"\n{'='*60}")
-    print("📊 TEST RESULTS SUMMARY")
-    print(f"{'='*60}")
+    if verbose:
+        cmd.extend(["-v", "-s"])
 
-    for suite_name, exit_code in results:
-        status = "✅ PASSED" if exit_code == 0 else "❌ FAILED"
-        print(f"{suite_name:25} {status}")
+    if coverage:
+        cmd.extend(["--cov=app", "--cov-report=term-missing"])
 
-    print(f"\nTotal test suites failed: {total_failures}")
+    cmd.extend(["--tb=short"])
 
-    return total_failures
+    return run_command(cmd, "Running All Tests")
 
 
 def run_specific_test(test_path, verbose=False):
@@ -155,18 +138,15 @@ def run_tests_by_marker(marker, verbose=False):
 
 def check_test_dependencies():
     """Check if test dependencies are available."""
-    try:
-        import factory
-        import faker
-        import httpx
-        import pytest
-
-        print("✅ Core test dependencies available")
-        return True
-    except ImportError as e:
-        print(f"❌ Missing test dependency: {e}")
-        print("Run: pip install -r requirements.txt")
-        return False
+    # find_spec locates the packages without paying their (slow) import cost
+    for name in ("factory", "faker", "httpx", "pytest"):
+        if importlib.util.find_spec(name) is None:
+            print(f"❌ Missing test dependency: No module named '{name}'")
+            print("Run: pip install -r requirements.txt")
+            return False
+
+    print("✅ Core test dependencies available")
+    return True
 
 
 def main():
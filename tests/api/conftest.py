@@ -0,0 +1,24 @@
+"""
+Shared fixtures for the API tests.
+"""
+
+import uuid
+
+import pytest
+from sqlalchemy import insert
+
+
+@pytest.fixture
+def bulk_insert(test_db, test_user):
+    """Return a helper that inserts the test user's rows of ``model`` in one statement, bypassing the API.
+
+    Each row gets a fresh id and the test user's id unless it sets its own; the helper returns the ids.
+    """
+
+    async def _insert(model, rows):
+        rows = [{"id": uuid.uuid4(), "user_id": test_user.id, **row} for row in rows]
+        await test_db.execute(insert(model), rows)
+        await test_db.commit()
+        return [row["id"] for row in rows]
+
+    return _insert
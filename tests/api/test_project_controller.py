@@ -6,10 +6,31 @@ testing all CRUD operations, project-todo relationships, and statistics.
 """
 
 import uuid
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
 
 import pytest
 from fastapi import status
 from httpx import AsyncClient
+from sqlalchemy import select
+
+from app.core.dependencies import get_current_user
+from app.main import app
+from models import Project, Todo
+
+
+@contextmanager
+def override_current_user(user):
+    """Serve requests as ``user`` inside the block, restoring the previous current user afterwards."""
+    previous = app.dependency_overrides.get(get_current_user)
+    app.dependency_overrides[get_current_user] = lambda: user
+    try:
+        yield
+    finally:
+        if previous is None:
+            app.dependency_overrides.pop(get_current_user, None)
+        else:
+            app.dependency_overrides[get_current_user] = previous
 
 
 class TestProjectController:
@@ -54,6 +75,7 @@ class TestProjectController:
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
     @pytest.mark.asyncio
+    @pytest.mark.no_db
     async def test_create_project_missing_name(self, authenticated_client: AsyncClient):
         """Test creating project without required name."""
         project_data = {"description": "Missing name"}
@@ -63,6 +85,7 @@ class TestProjectController:
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
     @pytest.mark.asyncio
+    @pytest.mark.no_db
     async def test_create_project_unauthorized(self, client: AsyncClient):
         """Test creating project without authentication."""
         project_data = {"name": "Unauthorized Project"}
@@ -72,12 +95,10 @@ class TestProjectController:
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
     @pytest.mark.asyncio
-    async def test_get_projects_list_basic(self, authenticated_client: AsyncClient):
+    async def test_get_projects_list_basic(self, authenticated_client: AsyncClient, bulk_insert):
         """Test getting basic projects list."""
         # Create test projects
-        for i in range(3):
-            project_data = {"name": f"Test Project {i}"}
-            await authenticated_client.post("/api/projects/", json=project_data)
+        await bulk_insert(Project, [{"name": f"Test Project {i}"} for i in range(3)])
 
         response = await authenticated_client.get("/api/projects/")
 
@@ -105,11 +126,10 @@ class TestProjectController:
         assert any("Important" in project["name"] for project in data["projects"])
 
     @pytest.mark.asyncio
-    async def test_get_projects_list_pagination(self, authenticated_client: AsyncClient):
+    async def test_get_projects_list_pagination(self, authenticated_client: AsyncClient, bulk_insert):
         """Test projects list pagination."""
         # Create multiple projects
-        for i in range(15):
-            await authenticated_client.post("/api/projects/", json={"name": f"Page Project {i}"})
+        await bulk_insert(Project, [{"name": f"Page Project {i}"} for i in range(15)])
 
         # Test first page
         response = await authenticated_client.get("/api/projects/?page=1&size=10")
@@ -145,7 +165,8 @@ class TestProjectController:
         data = response.json()
 
         # Find our project in the results
-        project = next(p for p in data["projects"] if p["id"] == project_id)
+        projects_by_id = {p["id"]: p for p in data["projects"]}
+        project = projects_by_id[project_id]
         assert project["todo_count"] == 3
         assert project["completed_todo_count"] == 1
 
@@ -190,6 +211,7 @@ class TestProjectController:
         assert data["message"] == "Project not found"
 
     @pytest.mark.asyncio
+    @pytest.mark.no_db
     async def test_get_project_by_id_invalid_uuid(self, authenticated_client: AsyncClient):
         """Test getting project with invalid UUID."""
         response = await authenticated_client.get("/api/projects/invalid-uuid")
@@ -260,7 +282,7 @@ class TestProjectController:
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
     @pytest.mark.asyncio
-    async def test_delete_project_success(self, authenticated_client: AsyncClient, test_project):
+    async def test_delete_project_success(self, authenticated_client: AsyncClient, test_db, test_project):
         """Test successful project deletion."""
         project_id = str(test_project.id)
 
@@ -272,34 +294,28 @@ class TestProjectController:
         assert data["message"] == "Project deleted successfully"
 
         # Verify project is deleted
-        get_response = await authenticated_client.get(f"/api/projects/{project_id}")
-        get_data = get_response.json()
-        assert get_data["status"] == "error"
+        assert await test_db.scalar(select(Project.id).where(Project.id == test_project.id)) is None
 
     @pytest.mark.asyncio
-    async def test_delete_project_with_todos(self, authenticated_client: AsyncClient, test_project):
+    async def test_delete_project_with_todos(self, authenticated_client: AsyncClient, test_db, test_project):
         """Test deleting project that has todos (should unassign them)."""
         # Add todos to the project
-        todo_responses = []
+        todo_ids = []
         for i in range(3):
             todo_response = await authenticated_client.post(
                 "/api/todos/",
                 json={"title": f"Project Todo {i}", "project_id": str(test_project.id)},
             )
-            todo_responses.append(todo_response)
+            todo_ids.append(uuid.UUID(todo_response.json()["data"]["id"]))
 
         project_id = str(test_project.id)
         response = await authenticated_client.delete(f"/api/projects/{project_id}")
 
         assert response.status_code == status.HTTP_200_OK
 
-        # Verify todos still exist but are unassigned from project
-        for todo_response in todo_responses:
-            todo_id = todo_response.json()["data"]["id"]
-            get_todo_response = await authenticated_client.get(f"/api/todos/{todo_id}")
-            get_todo_data = get_todo_response.json()
-            assert get_todo_data["status"] == "success"
-            assert get_todo_data["data"]["project_id"] is None
+        # Verify todos still exist but are unassigned from project, in one query
+        result = await test_db.execute(select(Todo.project_id).where(Todo.id.in_(todo_ids)))
+        assert result.scalars().all() == [None] * len(todo_ids)
 
     @pytest.mark.asyncio
     async def test_delete_project_nonexistent(self, authenticated_client: AsyncClient):
@@ -315,17 +331,13 @@ class TestProjectController:
         assert data["error_code"] == "NOT_FOUND"
 
     @pytest.mark.asyncio
-    async def test_get_project_stats(self, authenticated_client: AsyncClient):
+    async def test_get_project_stats(self, authenticated_client: AsyncClient, bulk_insert):
         """Test getting project statistics."""
         # Create projects with and without todos
-        project1_response = await authenticated_client.post("/api/projects/", json={"name": "Project with todos"})
-        project1_id = project1_response.json()["data"]["id"]
-
-        await authenticated_client.post("/api/projects/", json={"name": "Empty project"})
+        project1_id, _ = await bulk_insert(Project, [{"name": "Project with todos"}, {"name": "Empty project"}])
 
         # Add todos to first project
-        for i in range(3):
-            await authenticated_client.post("/api/todos/", json={"title": f"Todo {i}", "project_id": project1_id})
+        await bulk_insert(Todo, [{"project_id": project1_id, "title": f"Todo {i}"} for i in range(3)])
 
         response = await authenticated_client.get("/api/projects/stats/summary")
 
@@ -362,9 +374,9 @@ class TestProjectController:
         assert len(data["data"]["todos"]) == 3
 
         # Verify all todos belong to this project
-        for todo in data["data"]["todos"]:
-            assert todo["project_id"] == str(test_project.id)
-            assert todo["id"] in todo_ids
+        todos = data["data"]["todos"]
+        assert {todo["project_id"] for todo in todos} == {str(test_project.id)}
+        assert {todo["id"] for todo in todos} == set(todo_ids)
 
     @pytest.mark.asyncio
     async def test_get_project_todos_nonexistent_project(self, authenticated_client: AsyncClient):
@@ -389,87 +401,75 @@ class TestProjectController:
         assert len(data["data"]["todos"]) == 0
 
     @pytest.mark.asyncio
-    async def test_projects_unauthorized_access(self, client: AsyncClient, test_project):
-        """Test accessing project endpoints without authentication."""
-        endpoints = [
+    @pytest.mark.no_db
+    @pytest.mark.parametrize(
+        ("method", "endpoint"),
+        [
             ("GET", "/api/projects/"),
-            ("GET", f"/api/projects/{test_project.id}"),
-            ("PUT", f"/api/projects/{test_project.id}"),
-            ("DELETE", f"/api/projects/{test_project.id}"),
+            ("GET", "/api/projects/{project_id}"),
+            ("PUT", "/api/projects/{project_id}"),
+            ("DELETE", "/api/projects/{project_id}"),
             ("GET", "/api/projects/stats/summary"),
-            ("GET", f"/api/projects/{test_project.id}/todos"),
-        ]
+            ("GET", "/api/projects/{project_id}/todos"),
+        ],
+    )
+    async def test_projects_unauthorized_access(self, client: AsyncClient, method, endpoint):
+        """Test accessing project endpoints without authentication."""
+        # Authentication is rejected before the project is looked up, so any id will do
+        kwargs = {"json": {"name": "test"}} if method == "PUT" else {}
 
-        for method, endpoint in endpoints:
-            if method == "GET":
-                response = await client.get(endpoint)
-            elif method == "PUT":
-                response = await client.put(endpoint, json={"name": "test"})
-            elif method == "DELETE":
-                response = await client.delete(endpoint)
+        response = await getattr(client, method.lower())(endpoint.format(project_id=uuid.uuid4()), **kwargs)
 
-            assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.status_code == status.HTTP_403_FORBIDDEN
 
     @pytest.mark.asyncio
-    async def test_project_user_isolation(self, authenticated_client: AsyncClient, client: AsyncClient, test_user_2):
+    async def test_project_user_isolation(self, authenticated_client: AsyncClient, test_user_2):
         """Test that users can only access their own projects."""
         # Create project with first user
         project_response = await authenticated_client.post("/api/projects/", json={"name": "Private Project"})
         project_id = project_response.json()["data"]["id"]
 
         # Try to access with second user
-        def override_get_current_user_2():
-            return test_user_2
-
-        from app.core.dependencies import get_current_user
-        from app.main import app
+        with override_current_user(test_user_2):
+            response = await authenticated_client.get(f"/api/projects/{project_id}")
 
-        # Create authenticated client for second user
-        app.dependency_overrides[get_current_user] = override_get_current_user_2
-        from httpx import ASGITransport, AsyncClient
-
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as second_user_client:
-            response = await second_user_client.get(f"/api/projects/{project_id}")
-
-            assert response.status_code == status.HTTP_200_OK
-            data = response.json()
-            assert data["status"] == "error"
-            assert data["message"] == "Project not found"
-
-        # Clean up overrides
-        app.dependency_overrides.clear()
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["status"] == "error"
+        assert data["message"] == "Project not found"
 
     @pytest.mark.asyncio
-    async def test_project_validation_comprehensive(self, authenticated_client: AsyncClient):
-        """Test comprehensive validation for project creation."""
-        invalid_cases = [
+    @pytest.mark.no_db
+    @pytest.mark.parametrize(
+        "invalid_data",
+        [
             # Name too long (assuming 255 char limit)
             {"name": "x" * 256},
             # Empty name
             {"name": ""},
             {"name": "   "},  # Only whitespace
+        ],
+        ids=["too_long", "empty", "whitespace"],
+    )
+    async def test_project_validation_comprehensive(self, authenticated_client: AsyncClient, invalid_data):
+        """Test comprehensive validation for project creation."""
+        response = await authenticated_client.post("/api/projects/", json=invalid_data)
+        assert response.status_code in [
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+            status.HTTP_400_BAD_REQUEST,
         ]
 
-        for invalid_data in invalid_cases:
-            response = await authenticated_client.post("/api/projects/", json=invalid_data)
-            assert response.status_code in [
-                status.HTTP_422_UNPROCESSABLE_ENTITY,
-                status.HTTP_400_BAD_REQUEST,
-            ]
-
     @pytest.mark.asyncio
-    async def test_project_ordering(self, authenticated_client: AsyncClient):
+    async def test_project_ordering(self, authenticated_client: AsyncClient, bulk_insert):
         """Test that projects are returned in correct order (newest first)."""
-        # Create projects with known names
+        # Create projects with known names and increasing timestamps
         project_names = ["First Project", "Second Project", "Third Project"]
+        now = datetime.now(UTC)
 
-        for name in project_names:
-            await authenticated_client.post("/api/projects/", json={"name": name})
-            # Small delay to ensure different timestamps
-            import asyncio
-
-            await asyncio.sleep(0.01)
+        await bulk_insert(
+            Project,
+            [{"name": name, "updated_at": now + timedelta(seconds=i)} for i, name in enumerate(project_names)],
+        )
 
         response = await authenticated_client.get("/api/projects/")
 
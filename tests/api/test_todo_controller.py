@@ -5,13 +5,27 @@ This module contains comprehensive API endpoint tests for the todo controller,
 testing all CRUD operations, filtering, pagination, and hierarchical features.
 """
 
+import asyncio
 import uuid
 from datetime import UTC, datetime, timedelta
-from unittest.mock import patch
+from unittest.mock import AsyncMock
 
 import pytest
 from fastapi import status
 from httpx import AsyncClient
+from sqlalchemy import select
+
+from app.domains.todo.service import TodoService
+from models import Todo
+
+FAKE_ID = str(uuid.uuid4())  # Never inserted, so lookups by it always miss
+DUE_DATE = (datetime.now(UTC) + timedelta(days=7)).isoformat()
+
+
+@pytest.fixture(autouse=True)
+def ai_subtasks_override(monkeypatch):
+    """Keep todo creation from calling the AI service when subtask generation is requested."""
+    monkeypatch.setattr(TodoService, "_generate_ai_subtasks", AsyncMock(return_value=None))
 
 
 class TestTodoController:
@@ -26,7 +40,7 @@ class TestTodoController:
             "status": "todo",
             "priority": 4,
             "project_id": str(test_project.id),
-            "due_date": (datetime.now(UTC) + timedelta(days=7)).isoformat(),
+            "due_date": DUE_DATE,
         }
 
         response = await authenticated_client.post("/api/todos/", json=todo_data)
@@ -60,12 +74,11 @@ class TestTodoController:
             "generate_ai_subtasks": True,
         }
 
-        with patch("app.domains.todo.service.TodoService._generate_ai_subtasks"):
-            response = await authenticated_client.post("/api/todos/", json=todo_data)
+        response = await authenticated_client.post("/api/todos/", json=todo_data)
 
-            assert response.status_code == status.HTTP_201_CREATED
-            data = response.json()
-            assert data["data"]["title"] == "AI Enhanced Todo"
+        assert response.status_code == status.HTTP_201_CREATED
+        data = response.json()
+        assert data["data"]["title"] == "AI Enhanced Todo"
 
     @pytest.mark.asyncio
     async def test_create_subtask(self, authenticated_client: AsyncClient, test_todo):
@@ -86,8 +99,7 @@ class TestTodoController:
     @pytest.mark.asyncio
     async def test_create_todo_invalid_project(self, authenticated_client: AsyncClient):
         """Test creating todo with invalid project ID."""
-        fake_project_id = str(uuid.uuid4())
-        todo_data = {"title": "Invalid Project Todo", "project_id": fake_project_id}
+        todo_data = {"title": "Invalid Project Todo", "project_id": FAKE_ID}
 
         response = await authenticated_client.post("/api/todos/", json=todo_data)
 
@@ -112,12 +124,10 @@ class TestTodoController:
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
     @pytest.mark.asyncio
-    async def test_get_todos_list_basic(self, authenticated_client: AsyncClient):
+    async def test_get_todos_list_basic(self, authenticated_client: AsyncClient, bulk_insert):
         """Test getting basic todos list."""
         # Create some test todos first
-        for i in range(3):
-            todo_data = {"title": f"Test Todo {i}"}
-            await authenticated_client.post("/api/todos/", json=todo_data)
+        await bulk_insert(Todo, [{"title": f"Test Todo {i}"} for i in range(3)])
 
         response = await authenticated_client.get("/api/todos/")
 
@@ -190,11 +200,10 @@ class TestTodoController:
         assert any("Meeting" in todo["title"] for todo in data["todos"])
 
     @pytest.mark.asyncio
-    async def test_get_todos_list_pagination(self, authenticated_client: AsyncClient):
+    async def test_get_todos_list_pagination(self, authenticated_client: AsyncClient, bulk_insert):
         """Test todos list pagination."""
         # Create multiple todos
-        for i in range(15):
-            await authenticated_client.post("/api/todos/", json={"title": f"Page Todo {i}"})
+        await bulk_insert(Todo, [{"title": f"Page Todo {i}"} for i in range(15)])
 
         # Test first page
         response = await authenticated_client.get("/api/todos/?page=1&size=10")
@@ -238,8 +247,7 @@ class TestTodoController:
     @pytest.mark.asyncio
     async def test_get_todo_by_id_nonexistent(self, authenticated_client: AsyncClient):
         """Test getting non-existent todo."""
-        fake_id = str(uuid.uuid4())
-        response = await authenticated_client.get(f"/api/todos/{fake_id}")
+        response = await authenticated_client.get(f"/api/todos/{FAKE_ID}")
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
@@ -288,19 +296,16 @@ class TestTodoController:
     @pytest.mark.asyncio
     async def test_update_todo_nonexistent(self, authenticated_client: AsyncClient):
         """Test updating non-existent todo."""
-        fake_id = str(uuid.uuid4())
         update_data = {"title": "Should Fail"}
 
-        response = await authenticated_client.put(f"/api/todos/{fake_id}", json=update_data)
+        response = await authenticated_client.put(f"/api/todos/{FAKE_ID}", json=update_data)
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
     @pytest.mark.asyncio
-    async def test_delete_todo_success(self, authenticated_client: AsyncClient, test_todo):
+    async def test_delete_todo_success(self, authenticated_client: AsyncClient, test_db, test_todo):
         """Test successful todo deletion."""
-        todo_id = str(test_todo.id)
-
-        response = await authenticated_client.delete(f"/api/todos/{todo_id}")
+        response = await authenticated_client.delete(f"/api/todos/{test_todo.id}")
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
@@ -308,32 +313,27 @@ class TestTodoController:
         assert data["message"] == "Todo deleted successfully"
 
         # Verify todo is deleted
-        get_response = await authenticated_client.get(f"/api/todos/{todo_id}")
-        get_data = get_response.json()
-        assert get_data["status"] == "error"
+        assert await test_db.scalar(select(Todo.id).where(Todo.id == test_todo.id)) is None
 
     @pytest.mark.asyncio
-    async def test_delete_todo_with_subtasks(self, authenticated_client: AsyncClient, test_todo_with_subtasks):
+    async def test_delete_todo_with_subtasks(self, authenticated_client: AsyncClient, test_db, test_todo_with_subtasks):
         """Test deleting todo that has subtasks."""
-        parent_id = str(test_todo_with_subtasks.id)
-        subtask_ids = [str(subtask.id) for subtask in test_todo_with_subtasks.subtasks]
+        parent_id = test_todo_with_subtasks.id
+        subtask_ids = [subtask.id for subtask in test_todo_with_subtasks.subtasks]
 
         response = await authenticated_client.delete(f"/api/todos/{parent_id}")
 
         assert response.status_code == status.HTTP_200_OK
 
         # Verify parent and subtasks are deleted
-        for subtask_id in subtask_ids:
-            get_response = await authenticated_client.get(f"/api/todos/{subtask_id}")
-            get_data = get_response.json()
-            assert get_data["status"] == "error"
+        assert await test_db.scalar(select(Todo.id).where(Todo.id == parent_id)) is None
+        remaining = await test_db.scalars(select(Todo.id).where(Todo.id.in_(subtask_ids)))
+        assert remaining.all() == []
 
     @pytest.mark.asyncio
     async def test_delete_todo_nonexistent(self, authenticated_client: AsyncClient):
         """Test deleting non-existent todo."""
-        fake_id = str(uuid.uuid4())
-
-        response = await authenticated_client.delete(f"/api/todos/{fake_id}")
+        response = await authenticated_client.delete(f"/api/todos/{FAKE_ID}")
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
         data = response.json()
@@ -361,12 +361,17 @@ class TestTodoController:
         assert data["data"]["status"] == "todo"
 
     @pytest.mark.asyncio
-    async def test_get_todo_stats(self, authenticated_client: AsyncClient):
+    async def test_get_todo_stats(self, authenticated_client: AsyncClient, bulk_insert):
         """Test getting todo statistics."""
         # Create todos with different statuses
-        await authenticated_client.post("/api/todos/", json={"title": "Pending", "status": "todo"})
-        await authenticated_client.post("/api/todos/", json={"title": "In Progress", "status": "in_progress"})
-        await authenticated_client.post("/api/todos/", json={"title": "Completed", "status": "done"})
+        await bulk_insert(
+            Todo,
+            [
+                {"title": "Pending", "status": "todo"},
+                {"title": "In Progress", "status": "in_progress"},
+                {"title": "Completed", "status": "done", "completed_at": datetime.now(UTC)},
+            ],
+        )
 
         response = await authenticated_client.get("/api/todos/stats/summary")
 
@@ -394,21 +399,15 @@ class TestTodoController:
     @pytest.mark.asyncio
     async def test_get_todo_subtasks_nonexistent_parent(self, authenticated_client: AsyncClient):
         """Test getting subtasks of non-existent parent todo."""
-        fake_id = str(uuid.uuid4())
-
-        response = await authenticated_client.get(f"/api/todos/{fake_id}/subtasks")
+        response = await authenticated_client.get(f"/api/todos/{FAKE_ID}/subtasks")
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
     @pytest.mark.asyncio
-    async def test_get_todo_subtasks_pagination(self, authenticated_client: AsyncClient, test_todo):
+    async def test_get_todo_subtasks_pagination(self, authenticated_client: AsyncClient, test_todo, bulk_insert):
         """Test subtasks pagination."""
         # Create multiple subtasks
-        for i in range(15):
-            await authenticated_client.post(
-                "/api/todos/",
-                json={"title": f"Subtask {i}", "parent_todo_id": str(test_todo.id)},
-            )
+        await bulk_insert(Todo, [{"title": f"Subtask {i}", "parent_todo_id": test_todo.id} for i in range(15)])
 
         response = await authenticated_client.get(f"/api/todos/{test_todo.id}/subtasks?page=1&size=10")
 
@@ -432,22 +431,21 @@ class TestTodoController:
             ("GET", f"/api/todos/{test_todo.id}/subtasks"),
         ]
 
-        for method, endpoint in endpoints:
-            if method == "GET":
-                response = await client.get(endpoint)
-            elif method == "PUT":
-                response = await client.put(endpoint, json={"title": "test"})
-            elif method == "DELETE":
-                response = await client.delete(endpoint)
-            elif method == "PATCH":
-                response = await client.patch(endpoint)
-
+        # Requests are rejected before touching the database, so they can run concurrently
+        responses = await asyncio.gather(
+            *(
+                client.request(method, endpoint, json={"title": "test"} if method == "PUT" else None)
+                for method, endpoint in endpoints
+            )
+        )
+        for response in responses:
             assert response.status_code == status.HTTP_403_FORBIDDEN
 
     @pytest.mark.asyncio
-    async def test_todo_validation_comprehensive(self, authenticated_client: AsyncClient):
-        """Test comprehensive validation for todo creation."""
-        invalid_cases = [
+    @pytest.mark.no_db
+    @pytest.mark.parametrize(
+        "invalid_data",
+        [
             # Title too long (assuming 500 char limit)
             {"title": "x" * 501},
             # Invalid status
@@ -457,11 +455,13 @@ class TestTodoController:
             {"title": "Valid Title", "priority": 0},
             # Invalid due date format
             {"title": "Valid Title", "due_date": "invalid-date"},
+        ],
+        ids=["title_too_long", "invalid_status", "priority_too_high", "priority_too_low", "invalid_due_date"],
+    )
+    async def test_todo_validation_comprehensive(self, authenticated_client: AsyncClient, invalid_data):
+        """Test comprehensive validation for todo creation."""
+        response = await authenticated_client.post("/api/todos/", json=invalid_data)
+        assert response.status_code in [
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+            status.HTTP_400_BAD_REQUEST,
         ]
-
-        for invalid_data in invalid_cases:
-            response = await authenticated_client.post("/api/todos/", json=invalid_data)
-            assert response.status_code in [
-                status.HTTP_422_UNPROCESSABLE_ENTITY,
-                status.HTTP_400_BAD_REQUEST,
-            ]
@@ -15,8 +15,10 @@ from sqlalchemy.orm import selectinload
 
 from app.domains.project.service import ProjectService
 from app.domains.todo.service import TodoService
+from app.domains.todo.service_partitioned import PartitionedTodoService
 from app.domains.user.service import UserService
-from models import AITodoInteraction, Project, Todo, User
+from models import AITodoInteraction, Project, PushSubscription, Todo, TodoActive, TodoArchived, User
+from models.push_subscription import hash_endpoint
 
 
 class TestDatabaseIntegration:
@@ -88,6 +90,23 @@ class TestDatabaseIntegration:
         with pytest.raises(IntegrityError):
             await test_db.commit()
 
+    @pytest.mark.asyncio
+    async def test_push_subscription_endpoint_hash(self, test_db, test_user):
+        """Test push subscriptions are unique and looked up by endpoint hash."""
+        endpoint = "https://fcm.googleapis.com/fcm/send/abc123"
+        subscription = PushSubscription(user_id=test_user.id, endpoint=endpoint, p256dh_key="p256dh", auth_key="auth")
+        test_db.add(subscription)
+        await test_db.commit()
+
+        assert subscription.endpoint_hash == hash_endpoint(endpoint)
+
+        result = await test_db.execute(select(PushSubscription).where(PushSubscription.endpoint_matches(endpoint)))
+        assert result.scalar_one().id == subscription.id
+
+        test_db.add(PushSubscription(user_id=test_user.id, endpoint=endpoint, p256dh_key="other", auth_key="other"))
+        with pytest.raises(IntegrityError):
+            await test_db.commit()
+
     @pytest.mark.asyncio
     async def test_todo_project_relationship(self, test_db, test_user):
         """Test todo-project relationship integrity."""
@@ -210,6 +229,10 @@ class TestDatabaseIntegration:
         await test_db.delete(user)
         await test_db.commit()
 
+        # The database cascades the children (passive_deletes), so reload them instead of
+        # reading the stale instances still held in the identity map
+        test_db.expire_all()
+
         # Verify cascade deletion
         deleted_project = await test_db.get(Project, project_id)
         deleted_todo = await test_db.get(Todo, todo_id)
@@ -429,6 +452,38 @@ class TestDatabaseIntegration:
         assert len(interactions_list) >= 1
         assert interactions_list[0].id == interaction.id
 
+    @pytest.mark.asyncio
+    async def test_completed_todos_archived_in_batches(self, test_db, test_user):
+        """Test batched archival of old completed todos into the archive partition."""
+        old_completion = datetime.now(UTC) - timedelta(days=45)
+        old_done = [
+            TodoActive(user_id=test_user.id, title=f"Old Done {i}", status="done", completed_at=old_completion)
+            for i in range(3)
+        ]
+        recent_done = TodoActive(
+            user_id=test_user.id, title="Recent Done", status="done", completed_at=datetime.now(UTC)
+        )
+        still_active = TodoActive(user_id=test_user.id, title="Still Active", status="todo")
+        test_db.add_all([*old_done, recent_done, still_active])
+        await test_db.commit()
+
+        archived_count = await PartitionedTodoService(test_db).move_completed_todos_to_archive(
+            days_old=30, batch_size=2
+        )
+
+        assert archived_count == 3
+
+        archived = (
+            (await test_db.execute(select(TodoArchived).where(TodoArchived.user_id == test_user.id))).scalars().all()
+        )
+        assert {todo.id for todo in archived} == {todo.id for todo in old_done}
+        assert all(todo.archived_at is not None for todo in archived)
+
+        remaining_ids = (
+            (await test_db.execute(select(TodoActive.id).where(TodoActive.user_id == test_user.id))).scalars().all()
+        )
+        assert set(remaining_ids) == {recent_done.id, still_active.id}
+
     @pytest.mark.asyncio
     async def test_project_todo_statistics_integration(self, test_db, test_user):
         """Test integration between projects and todo statistics."""
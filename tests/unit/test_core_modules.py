@@ -4,6 +4,7 @@ Unit tests for Core modules - Simple tests to boost coverage.
 This module contains basic tests for core functionality to reach 80% coverage.
 """
 
+import uuid
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import jwt
@@ -389,3 +390,13 @@ class TestDatabaseModule:
         # Should be able to import Base
         assert Base is not None
         assert hasattr(Base, "metadata")
+
+    def test_base_model_ids_are_time_ordered(self):
+        """Test BaseModel primary keys are version 7 UUIDs that sort by creation time."""
+        from models.base import _uuid7
+
+        ids = [_uuid7() for _ in range(5)]
+
+        assert all(generated.version == 7 for generated in ids)
+        assert all(generated.variant == uuid.RFC_4122 for generated in ids)
+        assert [generated.bytes[:6] for generated in ids] == sorted(generated.bytes[:6] for generated in ids)
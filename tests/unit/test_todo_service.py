@@ -259,6 +259,28 @@ class TestTodoService:
         assert result["total"] == 1
         assert "Meeting" in result["items"][0].title
 
+    @pytest.mark.asyncio
+    async def test_get_todos_list_pagination(self, test_db, test_user):
+        """Test todos list totals on a partial last page and past the end."""
+        service = TodoService(test_db)
+
+        for i in range(5):
+            await service.create_todo(TodoCreate(title=f"Todo {i}"), test_user.id)
+
+        result = await service.get_todos_list(test_user.id, TodoFilter(), PaginationParams(page=2, size=3))
+
+        assert result["total"] == 5
+        assert len(result["items"]) == 2
+        assert result["total_pages"] == 2
+        assert result["has_next"] is False
+        assert result["has_prev"] is True
+
+        result = await service.get_todos_list(test_user.id, TodoFilter(), PaginationParams(page=3, size=3))
+
+        assert result["total"] == 5
+        assert result["items"] == []
+        assert result["has_next"] is False
+
     @pytest.mark.asyncio
     async def test_update_todo_success(self, test_db, test_user, test_todo):
         """Test successful todo update."""